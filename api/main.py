@@ -20,7 +20,13 @@ if API_DIR not in sys.path:
     sys.path.insert(0, API_DIR)
 
 # Import your existing functions using absolute imports
-from pipe import get_companies_summary, get_winners, read_csv_safely
+from pipe import (
+    apply_csv_schema,
+    get_companies_summary,
+    get_winners,
+    read_csv_safely,
+    read_stock_csv,
+)
 from validation import WinnersResponse, validate_csv_structure
 
 app = FastAPI(
@@ -44,9 +50,8 @@ def process_dataframe(df_raw: pd.DataFrame) -> WinnersResponse:
     This function is used by both endpoints to go from csv input to a winners list in JSON format.
     """
     try:
-        # Convert Date to datetime and sort
-        df_raw["Date"] = pd.to_datetime(df_raw["Date"])
-        df_raw = df_raw.sort_values(by="Date", ascending=True)
+        # Apply the declared schema, parse Date and sort only if out of order
+        df_raw = apply_csv_schema(df_raw)
 
         # Process the data using existing functions
         df_companies = get_companies_summary(df_raw)
@@ -108,19 +113,13 @@ async def get_daily_winners_from_file(file: UploadFile = File(...)) -> WinnersRe
         # Read uploaded file content
         content = await file.read()
 
-        # Convert bytes to string and then to pandas DataFrame
-        csv_string = content.decode("utf-8")
-
-        # Read CSV with all columns as strings initially for validation
-        df_raw = pd.read_csv(io.StringIO(csv_string), delimiter=";", dtype=str)
+        # Read CSV once with all columns as strings for validation
+        df_raw = read_stock_csv(io.BytesIO(content), dtype=str)
 
         # Validate CSV structure and content
         validate_csv_structure(df_raw)
 
-        # Now read again with proper dtypes for processing
-        df_raw = pd.read_csv(io.StringIO(csv_string), delimiter=";")
-
-        # Use the core processing function
+        # Use the core processing function, which casts to the declared schema
         return process_dataframe(df_raw)
 
     except Exception as e:
@@ -152,13 +151,13 @@ async def get_daily_winners() -> WinnersResponse:
         if not os.path.exists(file_path):
             raise HTTPException(status_code=404, detail=f"File '{file_path}' not found")
 
-        # Read the local CSV file safely
-        df_raw = read_csv_safely(file_path)
+        # Read the local CSV file safely, with all columns as strings for validation
+        df_raw = read_csv_safely(file_path, dtype=str)
 
         # Validate CSV structure and content
         validate_csv_structure(df_raw)
 
-        # Use the core processing function
+        # Use the core processing function, which casts to the declared schema
         return process_dataframe(df_raw)
 
     except FileNotFoundError:
@@ -3,10 +3,112 @@ import pandas as pd
 from IPython.display import display
 import shutil
 import tempfile
+import importlib.util
 import os
 
 
-def read_csv_safely(file_path):
+# CSV parse engines. "c" is the default pandas parser, "pyarrow" is the
+# multithreaded Arrow reader (requires the optional pyarrow package).
+# Set CSV_ENGINE in the environment to switch engine for the whole API.
+CSV_ENGINES = ("c", "pyarrow")
+
+
+def check_csv_engine(engine):
+    """
+    Check that the parse engine is known and that its package is installed.
+    Raises ValueError or ImportError otherwise.
+    """
+    if engine not in CSV_ENGINES:
+        raise ValueError(
+            f"Unknown CSV engine '{engine}'. Expected one of: {', '.join(CSV_ENGINES)}"
+        )
+    if engine == "pyarrow" and importlib.util.find_spec("pyarrow") is None:
+        raise ImportError(
+            "CSV engine 'pyarrow' requires pyarrow. Install it with the 'arrow' extra"
+        )
+    return engine
+
+
+# Checked at import so a misconfigured engine fails at startup, not per request
+CSV_ENGINE = check_csv_engine(os.environ.get("CSV_ENGINE", "c"))
+
+# Declared schema for the Date;Kod;Kurs feeds, so no dtype inference is needed
+CSV_DELIMITER = ";"
+CSV_VALUE_DTYPES = {"Kod": "string", "Kurs": "float64"}
+CSV_DTYPES = {"Date": str, **CSV_VALUE_DTYPES}
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def read_stock_csv(source, engine=None, dtype=None):
+    """
+    Read a semicolon separated stock CSV with the given parse engine.
+    Uses the declared schema unless another dtype is given (e.g. str for validation).
+    """
+    engine = check_csv_engine(engine or CSV_ENGINE)
+    if dtype is None:
+        dtype = CSV_DTYPES
+    if engine == "pyarrow":
+        return read_csv_arrow(source, dtype)
+    return pd.read_csv(source, delimiter=CSV_DELIMITER, engine=engine, dtype=dtype)
+
+
+def read_csv_header(source):
+    """
+    Read the column names from the first line of a CSV path or binary file object.
+    File objects are rewound so they can be read again.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            line = f.readline()
+    else:
+        position = source.tell()
+        line = source.readline()
+        source.seek(position)
+    return line.decode("utf-8-sig").rstrip("\r\n").split(CSV_DELIMITER)
+
+
+def read_csv_arrow(source, dtype):
+    """
+    Read a CSV with the pyarrow reader using an explicit Arrow schema.
+    Passing dtype to pd.read_csv would let Arrow infer types first and cast after,
+    so the column types are given to Arrow directly and empty cells stay null.
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    def to_arrow_type(column_dtype):
+        if column_dtype in (str, "string"):
+            return pa.string()
+        return pa.from_numpy_dtype(column_dtype)
+
+    if isinstance(dtype, dict):
+        column_dtypes = dtype
+    else:
+        column_dtypes = {column: dtype for column in read_csv_header(source)}
+
+    table = pa_csv.read_csv(
+        source,
+        parse_options=pa_csv.ParseOptions(delimiter=CSV_DELIMITER),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={
+                column: to_arrow_type(column_dtype)
+                for column, column_dtype in column_dtypes.items()
+            },
+            strings_can_be_null=True,
+        ),
+    )
+    df = table.to_pandas()
+
+    # Arrow strings come back as object columns, match pandas for "string" dtypes
+    string_columns = {
+        column: column_dtype
+        for column, column_dtype in column_dtypes.items()
+        if column_dtype == "string" and column in df.columns
+    }
+    return df.astype(string_columns)
+
+
+def read_csv_safely(file_path, engine=None, dtype=None):
     """
     Safely read CSV by creating a temporary copy first.
     Prevents conflicts with concurrent writes.
@@ -20,7 +122,7 @@ def read_csv_safely(file_path):
         # Copy original file to temp location
         shutil.copy2(file_path, temp_path)
         # Read from the copy
-        df = pd.read_csv(temp_path, delimiter=";")
+        df = read_stock_csv(temp_path, engine=engine, dtype=dtype)
         return df
     finally:
         # Always clean up temp file
@@ -28,13 +130,25 @@ def read_csv_safely(file_path):
             os.unlink(temp_path)
 
 
-def parse_csv(file_path):
-    df_raw = read_csv_safely(file_path)
-    df_raw["Date"] = pd.to_datetime(df_raw["Date"])
-    df_raw = df_raw.sort_values(by="Date", ascending=True)
+def apply_csv_schema(df_raw):
+    """
+    Cast the columns to the declared schema, parse Date with the fixed format
+    and order the rows by Date.
+    """
+    df_raw = df_raw.astype(CSV_VALUE_DTYPES)
+    df_raw["Date"] = pd.to_datetime(df_raw["Date"], format=DATE_FORMAT)
+
+    # Feeds are normally already in time order, only sort when they are not
+    if not df_raw["Date"].is_monotonic_increasing:
+        df_raw = df_raw.sort_values(by="Date", ascending=True)
     return df_raw
 
 
+def parse_csv(file_path, engine=None):
+    df_raw = read_csv_safely(file_path, engine=engine)
+    return apply_csv_schema(df_raw)
+
+
 def get_companies_summary(df_raw):
 
     latest_data = df_raw.groupby("Kod").last().reset_index()
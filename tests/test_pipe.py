@@ -0,0 +1,121 @@
+import pytest
+import pandas as pd
+import json
+import importlib.util
+import sys
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+API_DIR = os.path.join(BASE_DIR, "api")
+DATA_DIR = os.path.join(BASE_DIR, "data")
+if API_DIR not in sys.path:
+    sys.path.insert(0, API_DIR)
+
+import pipe
+from pipe import apply_csv_schema, get_companies_summary, get_winners, parse_csv
+
+
+@pytest.mark.parametrize("engine", pipe.CSV_ENGINES)
+@pytest.mark.parametrize("file_name", ["data1", "data2", "data3", "data4"])
+def test_engines_give_expected_winners(engine, file_name):
+    """Test that every parse engine gives the expected winners for the data files."""
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+
+    df_raw = parse_csv(os.path.join(DATA_DIR, f"{file_name}.csv"), engine=engine)
+    result = get_winners(get_companies_summary(df_raw))
+
+    with open(os.path.join(DATA_DIR, f"winners_{file_name}.json"), "r") as f:
+        expected_output = json.load(f)
+    assert result == expected_output
+
+
+@pytest.mark.parametrize("engine", pipe.CSV_ENGINES)
+def test_missing_kod_is_not_a_company(engine, tmp_path):
+    """Test that rows without a company code are not reported as a company."""
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+
+    with open(os.path.join(DATA_DIR, "data1.csv"), "r") as f:
+        lines = f.read().splitlines()
+    lines.insert(2, "2017-01-01 12:00:05;;999")
+    file_path = tmp_path / "data1.csv"
+    file_path.write_text("\n".join(lines) + "\n")
+
+    df_raw = parse_csv(str(file_path), engine=engine)
+    df_companies = get_companies_summary(df_raw)
+
+    assert df_raw["Kod"].isna().sum() == 1
+    assert not df_companies["kod"].isin(["nan", "None"]).any()
+
+
+def test_unknown_engine_is_rejected():
+    """Test that an unknown parse engine raises a ValueError."""
+    with pytest.raises(ValueError) as exc_info:
+        parse_csv(os.path.join(DATA_DIR, "data1.csv"), engine="python")
+
+    assert "Unknown CSV engine 'python'" in str(exc_info.value)
+
+
+def test_unknown_engine_in_env_fails_at_import(monkeypatch):
+    """Test that an unknown CSV_ENGINE setting fails when the module is loaded."""
+    monkeypatch.setenv("CSV_ENGINE", "arrow")
+    try:
+        with pytest.raises(ValueError) as exc_info:
+            importlib.reload(pipe)
+        assert "Unknown CSV engine 'arrow'" in str(exc_info.value)
+    finally:
+        monkeypatch.undo()
+        importlib.reload(pipe)
+
+
+def test_missing_pyarrow_is_rejected(monkeypatch):
+    """Test that the pyarrow engine is rejected when pyarrow is not installed."""
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+
+    with pytest.raises(ImportError) as exc_info:
+        pipe.check_csv_engine("pyarrow")
+    assert "requires pyarrow" in str(exc_info.value)
+
+
+def test_schema_skips_sort_for_ordered_input(monkeypatch):
+    """Test that rows already in time order are not sorted again."""
+    df = pd.DataFrame(
+        {
+            "Date": ["2017-01-01 12:00:00", "2017-01-01 12:00:01"],
+            "Kod": ["ABB", "NCC"],
+            "Kurs": ["217", "122"],
+        }
+    )
+
+    def fail_sort(*args, **kwargs):
+        raise AssertionError("sort_values should not be called")
+
+    monkeypatch.setattr(pd.DataFrame, "sort_values", fail_sort)
+    df = apply_csv_schema(df)
+
+    assert df["Date"].dtype == "datetime64[ns]"
+    assert df["Kurs"].dtype == "float64"
+
+
+def test_schema_sorts_unordered_input():
+    """Test that rows out of time order are sorted by Date."""
+    df = pd.DataFrame(
+        {
+            "Date": ["2017-01-01 12:00:01", "2017-01-01 12:00:00"],
+            "Kod": ["NCC", "ABB"],
+            "Kurs": ["122", "217"],
+        }
+    )
+    df = apply_csv_schema(df)
+
+    assert df["Date"].is_monotonic_increasing
+    assert list(df["Kod"]) == ["ABB", "NCC"]
+
+
+def test_schema_rejects_other_date_format():
+    """Test that dates not in YYYY-MM-DD HH:MM:SS format are rejected."""
+    df = pd.DataFrame({"Date": ["01/01/2017 12:00"], "Kod": ["ABB"], "Kurs": ["217"]})
+
+    with pytest.raises(ValueError):
+        apply_csv_schema(df)
@@ -4,6 +4,7 @@ from fastapi.testclient import TestClient
 import sys
 import os
 import json
+import shutil
 import requests
 
 # Set up paths
@@ -15,12 +16,23 @@ if API_DIR not in sys.path:
     sys.path.insert(0, API_DIR)
 
 # Import the FastAPI app
+import main
+import pipe
 from main import app
 
 # Create test client
 client = TestClient(app)
 
 
+@pytest.fixture(params=pipe.CSV_ENGINES)
+def csv_engine(request, monkeypatch):
+    """Run the endpoint tests with every CSV parse engine"""
+    if request.param == "pyarrow":
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(pipe, "CSV_ENGINE", request.param)
+    return request.param
+
+
 def test_health_endpoint():
     """Test the health check endpoint"""
     response = client.get("/health")
@@ -51,7 +63,7 @@ def test_invalid_file_type():
     assert "File must be a CSV" in response.json()["detail"]
 
 
-def test_all_data_files_parametrized():
+def test_all_data_files_parametrized(csv_engine):
     """Parametrized test to check all CSV files against their expected JSON outputs"""
     test_cases = [
         ("data1.csv", "winners_data1.json"),
@@ -78,6 +90,64 @@ def test_all_data_files_parametrized():
         ), f"Output mismatch for {csv_file}:\nExpected: {expected_output}\nActual: {actual_output}"
 
 
+def test_local_file_with_invalid_kurs(csv_engine, tmp_path, monkeypatch):
+    """Test that the local endpoint reports invalid prices from validation"""
+    shutil.copy(
+        os.path.join(DATA_DIR, "test_nan_in_kurs.csv"), tmp_path / "data1.csv"
+    )
+    monkeypatch.setattr(main, "DATA_DIR", str(tmp_path))
+
+    response = client.get("/get_daily_winners")
+
+    assert response.status_code == 500
+    detail = response.json()["detail"]
+    assert "Invalid data format in CSV" in detail
+    assert "Row 1" in detail
+    assert "not_a_number" in detail
+
+
+INVALID_ROWS = [
+    ("2017-01-01 12:00:05;;999", "Invalid data format in CSV"),
+    ("2017-01-01 12:00:05;NCC;", "Invalid data format in CSV"),
+    ("2017-01-01T12:00:05;NCC;999", "doesn't match format"),
+    ("2017-01-01;NCC;999", "doesn't match format"),
+]
+
+
+def csv_with_row(row: str) -> bytes:
+    """Helper function to insert a row after the first data row of data1.csv"""
+    with open(os.path.join(DATA_DIR, "data1.csv"), "r") as f:
+        lines = f.read().splitlines()
+    lines.insert(2, row)
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+@pytest.mark.parametrize("row, expected_detail", INVALID_ROWS)
+def test_upload_rejects_invalid_rows(csv_engine, row, expected_detail):
+    """Test that uploads with empty or badly formatted values are rejected"""
+    response = client.post(
+        "/get_daily_winners_from_file",
+        files={"file": ("data1.csv", csv_with_row(row), "text/csv")},
+    )
+
+    assert response.status_code == 500
+    assert expected_detail in response.json()["detail"]
+
+
+@pytest.mark.parametrize("row, expected_detail", INVALID_ROWS)
+def test_local_file_rejects_invalid_rows(
+    csv_engine, row, expected_detail, tmp_path, monkeypatch
+):
+    """Test that a local file with empty or badly formatted values is rejected"""
+    (tmp_path / "data1.csv").write_bytes(csv_with_row(row))
+    monkeypatch.setattr(main, "DATA_DIR", str(tmp_path))
+
+    response = client.get("/get_daily_winners")
+
+    assert response.status_code == 500
+    assert expected_detail in response.json()["detail"]
+
+
 def test_deployed_api_online():
     """Test the deployed online API on Vercel"""
     api_url = "https://stockmarket-demo.vercel.app/"